@@ -1,5 +1,6 @@
 import time
 import logging
+from collections import ChainMap
 from typing import Type
 
 from pymeasure.experiment import unique_filename, Results, Procedure
@@ -8,7 +9,7 @@ from pymeasure.display.windows import ManagedWindow
 from pymeasure.display.Qt import QtGui, QtWidgets, QtCore
 
 from .. import config
-from .widgets import TextWidget, ProgressBar
+from .widgets import TextWidget, ProgressBar, LogBuffer
 from ..procedures import BaseProcedure, ChipProcedure
 
 log = logging.getLogger(__name__)
@@ -27,7 +28,8 @@ class ExperimentWindow(ManagedWindow):
             sequencer_inputs = getattr(cls, 'SEQUENCER_INPUTS', None),
             # sequence_file = f'sequences/{cls.SEQUENCER_INPUTS[0]}_sequence.txt' if hasattr(cls, 'SEQUENCER_INPUTS') else None,
         )
-        if bool(eval(config['GUI']['dark_mode'])):
+        dark_mode = bool(eval(config['GUI']['dark_mode']))
+        if dark_mode:
             PlotFrame.LABEL_STYLE['color'] = '#AAAAAA'
 
         super().__init__(
@@ -41,10 +43,23 @@ class ExperimentWindow(ManagedWindow):
             **sequencer_kwargs,
             **kwargs
         )
-        if bool(eval(config['GUI']['dark_mode'])):
+        if dark_mode:
             self.plot_widget.plot_frame.setStyleSheet('background-color: black;')
             self.plot_widget.plot_frame.plot_widget.setBackground('k')
 
+        self.log_widget.view.setMaximumBlockCount(
+            config.getint('GUI', 'log_max_lines', fallback=5000)
+        )
+
+        # Append log records in batches instead of one HTML parse per record
+        try:
+            self.log_widget.handler.emitter.record.disconnect(self.log_widget.view.appendHtml)
+        except TypeError as e:
+            log.warning(f"Could not batch the log records, appending them one by one: {e}")
+        else:
+            self.log_buffer = LogBuffer(self.log_widget.view, parent=self)
+            self.log_widget.handler.connect(self.log_buffer.append)
+
         self.setWindowTitle(title)
         self.setWindowIcon(
             self.style().standardIcon(QtWidgets.QStyle.StandardPixmap.SP_ComputerIcon)
@@ -102,16 +117,31 @@ class SequenceWindow(QtWidgets.QMainWindow):
     for the sequence, and displays an ExperimentWindow for each procedure.
     """
     aborted: bool = False
-    status_labels = []
-    inputs_ignored = ['show_more', 'chained_exec']
+    inputs_ignored = frozenset(('show_more', 'chained_exec'))
+    status_colors: dict[str, QtGui.QColor] = {
+        color: QtGui.QColor(color) for color in ('white', 'yellow', 'green', 'red')
+    }
+    _status_pixmaps: dict[str, QtGui.QPixmap] = {}
 
     def __init__(self, procedure_list: list[Type[Procedure]], title: str = '', **kwargs):
         super().__init__(**kwargs)
         self.procedure_list = procedure_list
+        # Parallel lists: the status label of each row and the color it shows
+        self.status_labels: list[QtWidgets.QLabel] = []
+        self.status_label_colors: list[str] = []
+        # The ExperimentWindow of each step, and the step of each manager
+        self._windows: dict[int, ExperimentWindow] = {}
+        self._connections: dict[int, list[QtCore.QMetaObject.Connection]] = {}
+        self._step_by_manager: dict[QtCore.QObject, int] = {}
+        self._loop: QtCore.QEventLoop = None
+        # Abort/failure prompts that have not been answered yet
+        self._prompts: list[QtWidgets.QMessageBox] = []
 
         self.resize(200*(len(procedure_list)+1), 480)
         self.setWindowTitle(title + f" ({', '.join((proc.__name__ for proc in procedure_list))})")
 
+        # Build the whole widget tree before laying it out
+        self.setUpdatesEnabled(False)
         layout = QtWidgets.QHBoxLayout()
         layout.addLayout(self._get_procedure_vlayout(title))
 
@@ -121,19 +151,19 @@ class SequenceWindow(QtWidgets.QMainWindow):
         widget.layout().setSpacing(10)
         widget.layout().setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         layout.addWidget(widget)
+        # The inputs of each procedure are built after the window is shown,
+        # one per event loop iteration. Until then, a placeholder holds its place
+        self._inputs_widgets: list[InputsWidget] = [widget] + [None]*len(procedure_list)
+        self._pending_inputs: list[tuple[int, QtWidgets.QWidget, Type[Procedure], list[str]]] = []
+        base_set = set(base_inputs)
         for i, proc in enumerate(procedure_list):
             layout.addLayout(self._get_procedure_vlayout(proc.__name__))
-            proc_inputs = list(proc.INPUTS)
-            for input in base_inputs:
-                try:
-                    proc_inputs.remove(input)
-                except ValueError:
-                    pass
-
-            widget = InputsWidget(proc, inputs=proc_inputs)
-            widget.layout().setSpacing(10)
-            widget.layout().setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-            layout.addWidget(widget)
+            proc_inputs = [input for input in proc.INPUTS if input not in base_set]
+
+            placeholder = QtWidgets.QWidget()
+            layout.addWidget(placeholder)
+            self._pending_inputs.append((i + 1, placeholder, proc, proc_inputs))
+        self._pending_inputs.reverse()
 
         scroll_area = QtWidgets.QScrollArea()
         scroll_area.setWidgetResizable(True)
@@ -150,6 +180,7 @@ class SequenceWindow(QtWidgets.QMainWindow):
         vbox.addWidget(scroll_area, 1)
 
         self.queue_button = QtWidgets.QPushButton("Queue")
+        self.queue_button.setEnabled(not self._pending_inputs)
         vbox.addWidget(self.queue_button)
         self.queue_button.clicked.connect(self.queue)
 
@@ -157,133 +188,270 @@ class SequenceWindow(QtWidgets.QMainWindow):
         container.setLayout(vbox)
 
         self.setCentralWidget(container)
+        self.setUpdatesEnabled(True)
+
+        if self._pending_inputs:
+            QtCore.QTimer.singleShot(0, self._materialize_inputs)
+
+    def _materialize_inputs(self):
+        """Builds the next pending InputsWidget in place of its placeholder,
+        then schedules the following one, so the event loop can paint in
+        between. The Queue button is enabled once every procedure has its
+        inputs.
+        """
+        index, placeholder, proc, proc_inputs = self._pending_inputs.pop()
+        widget = InputsWidget(proc, inputs=proc_inputs)
+        widget.layout().setSpacing(10)
+        widget.layout().setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        placeholder.parentWidget().layout().replaceWidget(placeholder, widget)
+        placeholder.deleteLater()
+        self._inputs_widgets[index] = widget
+
+        if self._pending_inputs:
+            QtCore.QTimer.singleShot(0, self._materialize_inputs)
+        else:
+            self.queue_button.setEnabled(True)
+
+    @classmethod
+    def status_pixmap(cls, color: str) -> QtGui.QPixmap:
+        """Returns the status pixmap for the given color. Pixmaps are
+        implicitly shared, so a single one per color is used by all labels.
+        """
+        if color not in cls._status_pixmaps:
+            pixmap = QtGui.QPixmap(20, 20)
+            pixmap.fill(cls.status_colors[color])
+            cls._status_pixmaps[color] = pixmap
+        return cls._status_pixmaps[color]
 
     def _get_procedure_vlayout(self, class_name: str):
         vlayout = QtWidgets.QVBoxLayout()
         vlayout.setSpacing(0)
         vlayout.addWidget(QtWidgets.QLabel(class_name + '\n→'))
         self.status_labels.append(QtWidgets.QLabel(self))
-        pixmap = QtGui.QPixmap(20, 20)
-        pixmap.fill(QtGui.QColor('white'))
-        self.status_labels[-1].setPixmap(pixmap)
+        self.status_labels[-1].setPixmap(self.status_pixmap('white'))
+        self.status_label_colors.append('white')
         vlayout.addWidget(self.status_labels[-1])
         vlayout.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         return vlayout
 
+    @QtCore.pyqtSlot(int, str)
     def set_status(self, index: int, color: str):
-        def func():
-            pixmap = QtGui.QPixmap(20, 20)
-            pixmap.fill(QtGui.QColor(color))
-            self.status_labels[index + 1].setPixmap(pixmap)
-        return func
+        if self.status_label_colors[index + 1] == color:
+            return
+
+        self.status_label_colors[index + 1] = color
+        self.status_labels[index + 1].setPixmap(self.status_pixmap(color))
 
     def queue(self):
         log.info("Queueing the procedures.")
-        self.set_status(-1, 'yellow')()
+        self.setUpdatesEnabled(False)
+        self.set_status(-1, 'yellow')
         for i in range(len(self.procedure_list)):
-            self.set_status(i, 'white')()
+            self.set_status(i, 'white')
         self.queue_button.setEnabled(False)
-        inputs = self.findChildren(InputsWidget)
-        base_parameters = inputs[0].get_procedure()._parameters
+        self.setUpdatesEnabled(True)
+        # Build every procedure from its inputs once, before the first one runs
+        procedures = [widget.get_procedure() for widget in self._inputs_widgets]
+        base_parameters = procedures[0]._parameters
         base_parameters = {k: v for k, v in base_parameters.items() if k not in self.inputs_ignored}
         for i, proc in enumerate(self.procedure_list):
+            if self.aborted:
+                break
+
             # Spawn the corresponding ExperimentWindow and queue it
             if proc.__name__ == 'Wait':
-                wait_time = inputs[i+1].get_procedure().wait_time
-                self.set_status(i, 'yellow')()
+                wait_time = procedures[i+1].wait_time
+                self.set_status(i, 'yellow')
                 self.wait(wait_time)
-                self.set_status(i, 'green')()
+                self.set_status(i, 'green')
                 continue
 
-            window = ExperimentWindow(proc, title=proc.__name__)
-            procedure_parameters = inputs[i+1].get_procedure()._parameters
-            parameters = procedure_parameters | base_parameters
+            window = self.new_window(i, proc)
+            procedure_parameters = procedures[i+1]._parameters
+            # Common parameters take precedence, without copying either dict
+            parameters = ChainMap(base_parameters, procedure_parameters)
             window.set_parameters(parameters)
 
-            window.queue_button.hide()
-            window.browser_widget.clear_button.hide()
-            window.browser_widget.hide_button.hide()
-            window.browser_widget.open_button.hide()
-            window.browser_widget.show_button.hide()
             window.show()
             window.queue_button.click()
 
-            # Update the status label
-            window.manager.running.connect(self.set_status(i, 'yellow'))
-            window.manager.finished.connect(self.set_status(i, 'green'))
-            window.manager.failed.connect(self.set_status(i, 'red'))
-            window.manager.aborted.connect(self.set_status(i, 'red'))
-
-            # Window managing
-            window.manager.aborted.connect(self.aborted_procedure(window))
-            window.manager.failed.connect(self.failed_procedure(window))
-            window.manager.finished.connect(window.close)
-
             # Non-blocking wait for the procedure to finish
-            loop = QtCore.QEventLoop()
-            window.manager.aborted.connect(loop.quit)
-            window.manager.failed.connect(loop.quit)
-            window.manager.finished.connect(loop.quit)
-            loop.exec()
-
-            if self.aborted:
-                break
+            self._loop = QtCore.QEventLoop()
+            self._loop.exec()
 
         BaseProcedure.instruments.shutdown_all()
+        self.setUpdatesEnabled(False)
         self.queue_button.setEnabled(True)
         if not self.aborted: log.info("Sequence finished.")
-        self.set_status(-1, 'red' if self.aborted else 'green')()
+        self.set_status(-1, 'red' if self.aborted else 'green')
+        self.setUpdatesEnabled(True)
         self.aborted = False
 
-    @QtCore.pyqtSlot()
+    def new_window(self, index: int, proc: Type[Procedure]) -> ExperimentWindow:
+        """Creates the ExperimentWindow for the procedure at the given step.
+        Every step gets a new window (and manager), replacing the one from a
+        previous run of the sequence.
+        """
+        self._release_window(index)
+
+        window = ExperimentWindow(proc, title=proc.__name__)
+        window.queue_button.hide()
+        window.browser_widget.clear_button.hide()
+        window.browser_widget.hide_button.hide()
+        window.browser_widget.open_button.hide()
+        window.browser_widget.show_button.hide()
+
+        # One dispatcher per signal, which finds the step through the sender
+        manager = window.manager
+        self._step_by_manager[manager] = index
+        self._connections[index] = [
+            manager.running.connect(self._on_running),
+            manager.finished.connect(self._on_finished),
+            manager.failed.connect(self._on_failed),
+            manager.aborted.connect(self._on_aborted),
+        ]
+
+        self._windows[index] = window
+        return window
+
+    def _release_window(self, index: int):
+        """Disconnects and deletes the window of the given step, if any."""
+        window = self._windows.pop(index, None)
+        if window is None:
+            return
+
+        for connection in self._connections.pop(index, []):
+            QtCore.QObject.disconnect(connection)
+        self._step_by_manager.pop(window.manager, None)
+        if window.isVisible():
+            window.close()
+        window.deleteLater()
+
+    def _sender_step(self) -> tuple[int, ExperimentWindow]:
+        index = self._step_by_manager[self.sender()]
+        return index, self._windows[index]
+
+    def _on_running(self):
+        index, _ = self._sender_step()
+        self.set_status(index, 'yellow')
+
+    def _on_finished(self):
+        index, window = self._sender_step()
+        self.set_status(index, 'green')
+        window.close()
+        self._quit_loop()
+
+    def _on_failed(self):
+        index, window = self._sender_step()
+        self.set_status(index, 'red')
+        self.failed_procedure(window)()
+
+    def _on_aborted(self):
+        index, window = self._sender_step()
+        self.set_status(index, 'red')
+        self.aborted_procedure(window)()
+
+    def _quit_loop(self):
+        if self._loop is not None:
+            self._loop.quit()
+
     def aborted_procedure(self, window: ExperimentWindow, close_window=True):
         def func():
-            timeout = 30
+            remaining = 30
             t_text = lambda t: f'Abort (continuing in {t} s)'
-            t_iter = iter(range(timeout-1, -1, -1))
 
             window.abort_button.setEnabled(False)
+            # The answer only applies to the run of the sequence that asked
+            loop = self._loop
 
             reply = QtWidgets.QMessageBox(self)
-            reply.setWindowTitle(t_text(timeout))
+            reply.setWindowTitle(t_text(remaining))
             reply.setText('This experiment was aborted. Do you want to abort the rest of the sequence?')
             reply.setIcon(QtWidgets.QMessageBox.Icon.Warning)
             reply.setStandardButtons(QtWidgets.QMessageBox.StandardButton.Yes | QtWidgets.QMessageBox.StandardButton.No)
             reply.setDefaultButton(QtWidgets.QMessageBox.StandardButton.No)
             reply.setWindowModality(QtCore.Qt.WindowModality.NonModal)
 
-            # Create a QTimer to update the title every second
-            timer = QtCore.QTimer()
-            timer.timeout.connect(lambda: reply.setWindowTitle(t_text(next(t_iter))))
+            # A single timer counts down in the title and dismisses the
+            # message box when it reaches 0. It belongs to the message box
+            # and stops as soon as it is answered.
+            def countdown():
+                nonlocal remaining
+                remaining -= 1
+                if remaining > 0:
+                    reply.setWindowTitle(t_text(remaining))
+                else:
+                    timer.stop()
+                    reply.reject()
+
+            timer = QtCore.QTimer(reply)
+            timer.timeout.connect(countdown)
+            reply.finished.connect(timer.stop)
             timer.start(1000)
 
-            # Close the message box after timeout
-            QtCore.QTimer.singleShot(timeout*1000, reply.close)
+            # The sequence resumes (or stops) once the message box is closed
+            def on_finished():
+                self._prompts.remove(reply)
+                if loop is None or loop is not self._loop or not loop.isRunning():
+                    return
+
+                yes = reply.button(QtWidgets.QMessageBox.StandardButton.Yes)
+                if reply.clickedButton() == yes:
+                    log.warning("Sequence aborted.")
+                    self.aborted = True
 
-            result = reply.exec()
-            if result == QtWidgets.QMessageBox.StandardButton.Yes:
-                log.warning("Sequence aborted.")
-                self.aborted = True
+                if close_window:
+                    window.hide()
 
-            if close_window:
-                window.close()
+                self._quit_loop()
+
+            reply.setAttribute(QtCore.Qt.WidgetAttribute.WA_DeleteOnClose)
+            reply.finished.connect(on_finished)
+            self._prompts.append(reply)
+            reply.show()
 
         return func
 
-    @QtCore.pyqtSlot()
     def failed_procedure(self, window: ExperimentWindow):
         def func():
             log.error(f"Procedure {window.cls.__name__} failed to execute")
             self.aborted_procedure(window, close_window=False)()
         return func
 
+    def closeEvent(self, event):
+        # A running step asks before aborting. If the user refuses, the
+        # sequence keeps running and this window stays open
+        for window in self._windows.values():
+            if window.manager.is_running() and not window.close():
+                event.ignore()
+                return
+
+        # Stop the sequence, so queue() does not wait on a closed step
+        if self._loop is not None and self._loop.isRunning():
+            self.aborted = True
+            self._quit_loop()
+
+        # Pending prompts would act on the windows released below
+        for reply in self._prompts:
+            reply.finished.disconnect()
+            reply.close()
+        self._prompts.clear()
+
+        # Disconnect explicitly, so the handlers (and the windows they
+        # reference) are not kept alive by the managers' connections
+        for index in list(self._windows):
+            self._release_window(index)
+        super().closeEvent(event)
+
     def wait(self, wait_time: float, progress_bar: bool = True):
         """Waits for a given amount of time. Creates a progress bar."""
         log.info(f"Waiting for {wait_time} seconds.")
+        # Wait in an event loop, so the window stays responsive
+        self._loop = loop = QtCore.QEventLoop()
+        QtCore.QTimer.singleShot(int(wait_time*1000), loop.quit)
         if progress_bar:
             self.progress = ProgressBar(self, text="Waiting for the next procedure.")
+            self.progress.finished.connect(loop.quit)
             self.progress.start(wait_time)
-            self.progress.exec()
 
-        else:
-            time.sleep(wait_time)
+        loop.exec()
@@ -1,11 +1,13 @@
 import os
 import sys
 import logging
-from functools import partial
+import weakref
+from functools import lru_cache
 from importlib.metadata import metadata
 from typing import Type
 
 from pymeasure.experiment import Procedure
+from pymeasure.instruments import Instrument
 
 from .. import config, config_path, _config_file_used
 from ..cli import Scripts, parameters_to_db
@@ -13,12 +15,33 @@ from ..utils import remove_empty_data, get_status_message
 from ..procedures import Experiments, from_str
 from ..instruments import InstrumentManager, Instruments
 from .Qt import QtGui, QtWidgets, QtCore, Worker
-from .widgets import SQLiteWidget
+from .widgets import SQLiteWidget, read_text_file
 from .experiment_window import ExperimentWindow, SequenceWindow
 
 log = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _clean_doc(obj) -> str:
+    """Returns the docstring of obj without indentation."""
+    return (obj.__doc__ or '').replace('    ', '').strip()
+
+
+class _MenuCallback:
+    """Calls func with the given arguments, ignoring the arguments emitted
+    by the signal. A lighter alternative to functools.partial for the many
+    menu actions.
+    """
+    __slots__ = ('func', 'args')
+
+    def __init__(self, func: callable, *args):
+        self.func = func
+        self.args = args
+
+    def __call__(self, *_):
+        return self.func(*self.args)
+
+
 class MainWindow(QtWidgets.QMainWindow):
     """The main window for program. It contains buttons to open
     the experiment windows, sequence windows, and run scripts.
@@ -36,42 +59,47 @@ class MainWindow(QtWidgets.QMainWindow):
         settings_menu = menu.addMenu('&Settings')
         settings_menu.addAction('Edit settings', self.edit_settings)
 
+        self._procedure_entries = tuple(
+            (cls, name, _clean_doc(cls)) for cls, name in Experiments
+        )
+        self._sequence_entries = tuple(
+            (name, list_str, from_str(list_str))
+            for name, list_str in config.items('Sequences')
+        )
+        self._script_entries = tuple(
+            (f, name, _clean_doc(sys.modules[f.__module__])) for f, name in Scripts
+        )
+
         procedure_menu = menu.addMenu('&Procedures')
         procedure_menu.setToolTipsVisible(True)
-        for cls, name in Experiments:
+        for cls, name, doc in self._procedure_entries:
             action = QtGui.QAction(name, self)
-            doc = cls.__doc__.replace('    ', '').strip()
-            action.triggered.connect(partial(self.open_app, cls))
+            action.triggered.connect(_MenuCallback(self.open_app, cls))
             action.setToolTip(doc)
             action.setStatusTip(doc)
             procedure_menu.addAction(action)
 
         sequence_menu = menu.addMenu('Se&quences')
         sequence_menu.setToolTipsVisible(True)
-        for name, list_str in config.items('Sequences'):
+        for name, doc, procedure_list in self._sequence_entries:
             action = QtGui.QAction(name, self)
-            doc = list_str
-            action.triggered.connect(partial(
-                self.open_sequence, name, from_str(list_str)
-            ))
+            action.triggered.connect(_MenuCallback(self.open_sequence, name, procedure_list))
             action.setToolTip(doc)
             action.setStatusTip(doc)
             sequence_menu.addAction(action)
 
         script_menu = menu.addMenu('&Scripts')
         script_menu.setToolTipsVisible(True)
-        for f, name in Scripts:
+        for f, name, doc in self._script_entries:
             action = QtGui.QAction(name, self)
-            doc = sys.modules[f.__module__].__doc__ or ''
-            doc = doc.replace('    ', '').strip()
-            action.triggered.connect(partial(self.run_script, f))
+            action.triggered.connect(_MenuCallback(self.run_script, f))
             action.setToolTip(doc)
             action.setStatusTip(doc)
             script_menu.addAction(action)
 
         view_menu = menu.addMenu('&View')
         view_menu.addAction(
-            'Parameter Database', partial(self.open_database, 'parameters.db')
+            'Parameter Database', _MenuCallback(self.open_database, 'parameters.db')
         )
 
         help_menu = menu.addMenu('&Help')
@@ -80,14 +108,13 @@ class MainWindow(QtWidgets.QMainWindow):
         instrument_help = help_menu.addMenu('Instruments')
         for cls, name in Instruments:
             action = QtGui.QAction(name, self)
-            action.triggered.connect(partial(
-                self.text_window, name, InstrumentManager.help(cls, return_str=True)
-            ))
+            action.triggered.connect(_MenuCallback(self.instrument_help, cls, name))
             instrument_help.addAction(action)
 
         self.status_bar = self.statusBar()
+        self._threads: weakref.WeakSet[QtCore.QThread] = weakref.WeakSet()
 
-        thread = QtCore.QThread(parent=self)
+        thread = self.new_thread()
         worker = Worker(get_status_message, thread)
         worker.finished.connect(lambda msg: self.status_bar.showMessage(msg, 3000))
         thread.start()
@@ -103,10 +130,8 @@ class MainWindow(QtWidgets.QMainWindow):
         readme.setStyleSheet("""
             font-size: 12pt;
         """)
-        try:
-            with open('README.md') as f:
-                readme_text = f.read()
-        except FileNotFoundError:
+        readme_text = read_text_file('README.md')
+        if readme_text is None:
             readme_text = metadata('laser_setup').get('Description')
         readme.setMarkdown(readme_text)
         self._layout.addWidget(readme)
@@ -118,6 +143,15 @@ class MainWindow(QtWidgets.QMainWindow):
         )   # TODO: fix bug where the terminal misbehaves after reload
         self.status_bar.addPermanentWidget(self.reload)
 
+    def new_thread(self) -> QtCore.QThread:
+        """Creates a QThread owned by this window. The thread is tracked
+        until it finishes, so it can be stopped when the window closes.
+        """
+        thread = QtCore.QThread(parent=self)
+        self._threads.add(thread)
+        thread.finished.connect(lambda t=thread: self._threads.discard(t))
+        return thread
+
     def open_sequence(self, name: str, procedure_list: list[Type[Procedure]]):
         self.windows[name] = SequenceWindow(procedure_list, title=name, parent=self)
         self.windows[name].show()
@@ -194,6 +228,12 @@ class MainWindow(QtWidgets.QMainWindow):
         text_window.setLayout(text_layout)
         text_window.exec()
 
+    def instrument_help(self, cls: Type[Instrument], name: str):
+        """Displays the help of the instrument class. The help text is
+        only generated when it is requested.
+        """
+        self.text_window(name, InstrumentManager.help(cls, return_str=True))
+
     def open_database(self, db_name: str):
         path = config['Filename']['directory'] + '/' + db_name
         if not os.path.exists(path):
@@ -213,10 +253,10 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def closeEvent(self, event):
         """Ensures all running threads are properly stopped."""
-        for child in self.findChildren(QtCore.QThread):
-            if child.isRunning():
-                child.quit()
-                child.wait()
+        for thread in list(self._threads):
+            if thread.isRunning():
+                thread.quit()
+                thread.wait()
         super().closeEvent(event)
 
 
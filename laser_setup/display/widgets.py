@@ -1,7 +1,26 @@
-import time
+import os
+import logging
 
 from pymeasure.display.widgets import TabWidget
-from .Qt import QtWidgets, QtCore, QtSql
+from .Qt import QtGui, QtWidgets, QtCore, QtSql
+
+log = logging.getLogger(__name__)
+
+
+def read_text_file(file: str) -> str | None:
+    """Reads a text file through Qt, so the contents can be handed to a
+    widget without an intermediate Python read. Returns None if the file
+    could not be opened.
+    """
+    qfile = QtCore.QFile(file)
+    if not qfile.open(
+        QtCore.QIODevice.OpenModeFlag.ReadOnly | QtCore.QIODevice.OpenModeFlag.Text
+    ):
+        return None
+
+    text = QtCore.QTextStream(qfile).readAll()
+    qfile.close()
+    return text
 
 
 class ProgressBar(QtWidgets.QDialog):
@@ -21,30 +40,86 @@ class ProgressBar(QtWidgets.QDialog):
 
     def start(self, wait_time: float, fps: float = 30., decimals: int = 0):
         self.wait_time = wait_time
-        self.frame_interval = 1 / fps
+        self.fps = fps
         self.total_frames = int(fps * wait_time)
-        self.start_time = time.perf_counter()
+        self.elapsed_timer = QtCore.QElapsedTimer()
+        self.elapsed_timer.start()
         self.progress.setRange(0, self.total_frames)
+        self.d = decimals
+        self._denom = f"{wait_time:.{decimals}f}"
+        self._last_frame = -1
+        self._last_text = ''
         self.show()
         self.timer.start(max(1, round(1000 / fps)))
-        self.d = decimals
 
     def _update_progress(self):
-        elapsed_time = time.perf_counter() - self.start_time
-        current_frame = int(elapsed_time / self.frame_interval)
+        elapsed_ms = self.elapsed_timer.elapsed()
+        current_frame = min(int(elapsed_ms * self.fps) // 1000, self.total_frames)
+        if current_frame == self._last_frame:
+            return
 
+        self._last_frame = current_frame
         if current_frame >= self.total_frames:
-            self.progress.setValue(self.total_frames)
-            self.progress.setFormat(
-                f"{self.wait_time:.{self.d}f} / {self.wait_time:.{self.d}f} s"
-            )
+            self._set_progress(current_frame, self._denom)
             self.timer.stop()
             self.close()
         else:
-            self.progress.setValue(current_frame)
-            self.progress.setFormat(
-                f"{elapsed_time:.{self.d}f} / {self.wait_time:.{self.d}f} s"
-            )
+            self._set_progress(current_frame, f"{elapsed_ms / 1000:.{self.d}f}")
+
+    def _set_progress(self, frame: int, elapsed_text: str):
+        self.progress.setValue(frame)
+        text = f"{elapsed_text} / {self._denom} s"
+        if text != self._last_text:
+            self._last_text = text
+            self.progress.setFormat(text)
+
+
+class LogBuffer(QtCore.QObject):
+    """Collects formatted log records and appends them to a text view in
+    batches, so the document is laid out once per interval instead of once
+    per record.
+    """
+    def __init__(self, view: QtWidgets.QPlainTextEdit, interval: int = 50, parent=None):
+        super().__init__(parent)
+        self.view = view
+        self._pending: list[str] = []
+        self.timer = QtCore.QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.flush)
+
+    def append(self, html: str):
+        self._pending.append(html)
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def flush(self):
+        if not self._pending:
+            return
+
+        scrollbar = self.view.verticalScrollBar()
+        at_bottom = scrollbar.value() == scrollbar.maximum()
+
+        document = self.view.document()
+        cursor = QtGui.QTextCursor(document)
+        cursor.movePosition(QtGui.QTextCursor.MoveOperation.End)
+        # Like appendHtml, each record starts from the default formats, so
+        # the style of one record does not carry over to the next
+        block_format = QtGui.QTextBlockFormat()
+        char_format = QtGui.QTextCharFormat()
+        cursor.beginEditBlock()
+        for html in self._pending:
+            if not document.isEmpty():
+                cursor.insertBlock(block_format, char_format)
+            else:
+                cursor.setBlockFormat(block_format)
+                cursor.setCharFormat(char_format)
+            cursor.insertHtml(html)
+        cursor.endEditBlock()
+        self._pending.clear()
+
+        if at_bottom:
+            scrollbar.setValue(scrollbar.maximum())
 
 
 class TextWidget(TabWidget, QtWidgets.QWidget):
@@ -55,10 +130,8 @@ class TextWidget(TabWidget, QtWidgets.QWidget):
         self.view.setStyleSheet("""
             font-size: 12pt;
         """)
-        try:
-            with open(file, encoding='utf-8') as f:
-                readme_text = f.read()
-        except:
+        readme_text = read_text_file(file) if file else None
+        if readme_text is None:
             readme_text = f'{file} not found :('
         self.view.setMarkdown(readme_text)
 
@@ -72,27 +145,38 @@ class TextWidget(TabWidget, QtWidgets.QWidget):
 class SQLiteWidget(QtWidgets.QWidget):
     """Widget to display and interact with the contents of a SQLite database."""
     select_text = "Select a table..."
+    pragmas = (
+        "PRAGMA temp_store=MEMORY;",
+        "PRAGMA mmap_size=268435456;",
+        "PRAGMA cache_size=-65536;",
+    )
     def __init__(self, database: str, default_table: str = None, parent=None):
         super().__init__(parent)
 
-        # Initialize database connection
+        # Initialize database connection, shared between widgets of the same file
         self.database = database
-        self.con = QtSql.QSqlDatabase.addDatabase('QSQLITE')
-        self.con.setDatabaseName(self.database)
-
-        if not self.con.open():
-            raise Exception(f"Unable to open database: {self.database}")
+        self.con = self.get_connection(database)
 
         # Initialize model
         self.model = QtSql.QSqlTableModel(self, self.con)
-        if default_table:
-            self.model.setTable(default_table)
-            self.model.select()
 
         # Set up the table view
         self.view = QtWidgets.QTableView(self)
         self.view.setModel(self.model)
-        self.view.resizeColumnsToContents()
+
+        # Size only the visible columns, and only once there is data to size.
+        # The first table is sized when the widget is first shown, once the
+        # viewport has its real width
+        header = self.view.horizontalHeader()
+        header.setSectionResizeMode(QtWidgets.QHeaderView.ResizeMode.Interactive)
+        header.setDefaultSectionSize(120)
+        self.model.modelReset.connect(self.resize_visible_columns)
+        self.view.horizontalScrollBar().valueChanged.connect(self.resize_visible_columns)
+        self._shown = False
+
+        if default_table:
+            self.model.setTable(default_table)
+            self.model.select()
 
         # Enable sorting on columns
         self.view.setSortingEnabled(True)
@@ -109,10 +193,50 @@ class SQLiteWidget(QtWidgets.QWidget):
         # Add a combo box to select different tables
         self.add_table_selector()
 
+    @classmethod
+    def get_connection(cls, database: str) -> QtSql.QSqlDatabase:
+        """Returns an open connection to the database. Connections are named
+        after the database path and file identity, so they are opened (and
+        tuned) only once and reused by every widget displaying the same file.
+        A file replaced at the same path (e.g. by parameters_to_db) gets a new
+        connection instead of the handle to the old one.
+        """
+        name = os.path.abspath(database)
+        try:
+            stat = os.stat(database)
+            name += f':{stat.st_dev}:{stat.st_ino}'
+        except OSError:
+            pass
+
+        if QtSql.QSqlDatabase.contains(name):
+            con = QtSql.QSqlDatabase.database(name)
+            if con.isOpen():
+                return con
+
+        else:
+            con = QtSql.QSqlDatabase.addDatabase('QSQLITE', name)
+            con.setDatabaseName(database)
+
+        if not con.open():
+            raise Exception(f"Unable to open database: {database}")
+
+        cls.set_pragmas(con)
+        return con
+
+    @classmethod
+    def set_pragmas(cls, con: QtSql.QSqlDatabase):
+        """Tunes the connection for read-heavy browsing (memory-mapped I/O
+        and a larger page cache). These only affect this connection, the
+        database file itself is not modified.
+        """
+        query = QtSql.QSqlQuery(con)
+        for pragma in cls.pragmas:
+            if not query.exec(pragma):
+                log.debug(f"Could not set '{pragma}': {query.lastError().text()}")
+
     def add_table_selector(self):
         """Add a combo box to select different tables."""
         self.table_selector = QtWidgets.QComboBox(self)
-        self.table_selector.addItem(self.select_text)
 
         # Populate combo box with available tables
         self.populate_table_selector()
@@ -129,13 +253,42 @@ class SQLiteWidget(QtWidgets.QWidget):
         self.layout().addLayout(hbox)
 
     def populate_table_selector(self):
-        """Populate the combo box with available table names."""
+        """Populate the combo box with available table names. The items are
+        collected in a separate model, so the combo box is reset only once.
+        """
+        model = QtGui.QStandardItemModel(self.table_selector)
+        model.appendRow(QtGui.QStandardItem(self.select_text))
+
         query = QtSql.QSqlQuery(self.con)
-        query.exec("SELECT name FROM sqlite_master WHERE type='table';")
+        query.setForwardOnly(True)
+        query.prepare("SELECT name FROM sqlite_master WHERE type='table';")
+        query.exec()
 
         while query.next():
             table_name = query.value(0)
-            self.table_selector.addItem(table_name)
+            model.appendRow(QtGui.QStandardItem(table_name))
+
+        self.table_selector.setModel(model)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._shown:
+            self._shown = True
+            self.resize_visible_columns()
+
+    def resize_visible_columns(self):
+        """Resize the columns currently in the viewport to their contents."""
+        width = self.view.viewport().width()
+        first = self.view.columnAt(0)
+        last = self.view.columnAt(width - 1)
+        if first < 0:
+            return
+
+        if last < 0:
+            last = self.model.columnCount() - 1
+
+        for col in range(first, last + 1):
+            self.view.resizeColumnToContents(col)
 
     def change_table(self):
         """Change the table displayed by the model."""
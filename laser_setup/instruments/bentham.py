@@ -1,5 +1,6 @@
 import logging
 import bendev.exceptions
+from contextlib import contextmanager
 
 import bendev
 from pymeasure.instruments import Instrument
@@ -14,6 +15,9 @@ class Bentham(Instrument):
     bendev.Device object for the communication.
     """
     wavelength_range = [280., 1100.]
+    supports_compound_scpi = True
+    _batch: list[str] | None = None
+    _batch_depth: int = 0
 
     goto = Instrument.control(
         ":MONO:GOTO?", ":MONO:GOTO? %.1f",
@@ -115,17 +119,78 @@ class Bentham(Instrument):
         self.write("SYST:REM")
 
     def set_wavelength(self, wavelength: float, timeout: float = 10.):
-        """Sets the wavelength to the specified value."""
-        self.write(":MONO:FILT 1")
-        self.move
-        self.wavelength = wavelength
-        self.filt = wavelength
-        self.move
+        """Sets the wavelength to the specified value. The commands are sent
+        as a single compound SCPI message, unless supports_compound_scpi is
+        False, in which case they are written one by one.
+        """
+        wavelength = truncated_range(wavelength, self.wavelength_range)
+        commands = (
+            ":MONO:FILT 1",
+            ":MONO:MOVE",
+            f":MONO:WAVE {wavelength:.1f}",
+            f":MONO:FILT:WAVE {wavelength:.1f}",
+            ":MONO:MOVE",
+        )
+        if self.supports_compound_scpi:
+            self.write(";".join(commands))
+        else:
+            for command in commands:
+                self.write(command)
+
+    def wait_for_target(self, timeout: float = 10.) -> str:
+        """Moves the monochromator to its targets and waits until the move is
+        complete, with a single query instead of polling at_target.
+
+        :param timeout: The maximum time to wait for the reply in seconds.
+        """
+        return self.query(":MONO:MOVE;*OPC?", timeout=timeout)
+
+    @contextmanager
+    def batch(self):
+        """Queues the commands written inside the context, and sends them
+        as a single compound SCPI message when it exits. Reads send the
+        queued commands first, so queries inside the context still work.
+        Nested contexts share the queue of the outermost one, which sends it.
+        If the body raises, the queued commands are discarded, so a partial
+        batch never reaches the monochromator.
+        """
+        if self._batch_depth == 0:
+            self._batch = []
+        self._batch_depth += 1
+        try:
+            yield self
+        except BaseException:
+            self._batch = []
+            raise
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_batch()
+                self._batch = None
+
+    def _flush_batch(self):
+        if not self._batch:
+            return
+
+        commands, self._batch = self._batch, []
+        if self.supports_compound_scpi:
+            super().write(";".join(commands))
+        else:
+            for command in commands:
+                super().write(command)
+
+    def write(self, command: str, **kwargs):
+        if self._batch is not None:
+            self._batch.append(command)
+        else:
+            super().write(command, **kwargs)
 
     def read(self, timeout: float = 0, read_interval: float = 0.05) -> str:
+            self._flush_batch()
             return self.adapter.read(timeout, read_interval)
 
     def query(self, command, timeout: float = 0, read_interval: float = 0.05) -> str:
+        self._flush_batch()
         return self.adapter.query(command, timeout, read_interval)
 
     def shutdown(self):
@@ -1,5 +1,7 @@
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import TypeVar, Dict
 
 from pymeasure.adapters import FakeAdapter
@@ -7,14 +9,54 @@ from pymeasure.instruments import Instrument
 
 log = logging.getLogger(__name__)
 AnyInstrument = TypeVar('AnyInstrument', bound=Instrument)
+_DEBUG_MODE = '-d' in sys.argv or '--debug' in sys.argv
 
 
-class PendingInstrument(Instrument):
+@lru_cache(maxsize=None)
+def _help_str(cls: AnyInstrument) -> str:
+    """Builds the help string of InstrumentManager.help. The controls and
+    measurements of a class don't change, so it is built once per class.
+    """
+    # Collect the properties along the MRO, without triggering descriptors.
+    # Subclass definitions take precedence over the ones they override
+    properties: Dict[str, property] = {}
+    seen = set()
+    for klass in cls.__mro__:
+        for name, attr in vars(klass).items():
+            if name in seen:
+                continue
+
+            seen.add(name)
+            if isinstance(attr, property):
+                properties[name] = attr
+
+    lines = [f"Available controls and measurements for {cls.__name__} (not including methods):\n"]
+    for name in sorted(properties):
+        attr = properties[name]
+        kind = 'measurement' if attr.fset is None or attr.fset.__doc__ is None else 'control'
+        lines.append(f"    {name} ({kind}): {attr.__doc__} \n")
+
+        # Commands and values, only available for PyMeasure properties
+        try:
+            defaults = f"fget: '{attr.fget.__defaults__[0]}'"
+            if attr.fset is not None:
+                defaults += f", fset: '{attr.fset.__defaults__[0]}'"
+            defaults += f", values={attr.fget.__defaults__[1]}"
+        except (AttributeError, TypeError, IndexError):
+            continue
+
+        lines.append(12*" " + defaults + "\n\n")
+
+    return ''.join(lines)
+
+
+class PendingInstrument:
     """A placeholder for an instrument that is pending initialization.
 
     This class holds the configuration for an instrument that will be connected
     and initialized at a later stage. It allows for the deferred setup of instruments,
-    enabling dynamic and flexible instrument management within procedures.
+    enabling dynamic and flexible instrument management within procedures. It is
+    never used as an instrument itself, so it only stores the configuration.
 
     :param cls: The class of the instrument to be initialized.
     :param adapter: The adapter string for the instrument connection.
@@ -22,6 +64,8 @@ class PendingInstrument(Instrument):
     :param includeSCPI: Flag indicating whether to include SCPI commands.
     :param kwargs: Additional keyword arguments for instrument configuration.
     """
+    __slots__ = ('config',)
+
     def __init__(
         self,
         cls: AnyInstrument = Instrument,
@@ -30,7 +74,7 @@ class PendingInstrument(Instrument):
         includeSCPI=False,
         **kwargs
     ):
-        self.config = {
+        self.config: dict = {
             'cls': cls,
             'adapter': adapter,
             'name': name,
@@ -49,6 +93,7 @@ class InstrumentManager:
     shutdown.
 
     :method connect: Connects to an instrument and saves it in the instances dictionary.
+    :method connect_all: Connects to several pending instruments concurrently.
     :method setup_adapter: Returns an instance of the given instrument class.
     :method shutdown: Safely shuts down the instrument with the given name.
     :method shutdown_all: Safely shuts down all instruments.
@@ -70,21 +115,7 @@ class InstrumentManager:
         :param cls: The instrument class to get the help from.
         :param return_str: Whether to return the help string or print it.
         """
-        help_str = f"Available controls and measurements for {cls.__name__} (not including methods):\n"
-        for name in dir(cls):
-            try:
-                attr = getattr(cls, name)
-                if isinstance(attr, property):
-                    if attr.fset.__doc__ is None:
-                        help_str += f"    {name} (measurement): {attr.__doc__} \n"
-                    else:
-                        help_str += f"    {name} (control): {attr.__doc__} \n"
-
-                    help_str += 12*" " + f"fget: '{attr.fget.__defaults__[0]}', fset: '{attr.fset.__defaults__[0]}', values={attr.fget.__defaults__[1]}\n\n"
-
-            except Exception:
-                continue
-
+        help_str = _help_str(cls)
         return help_str if return_str else print(help_str)
 
 
@@ -103,7 +134,7 @@ class InstrumentManager:
         try:
             instrument: AnyInstrument = cls(adapter, **kwargs)
         except Exception as e:
-            if '-d' in sys.argv or '--debug' in sys.argv:
+            if _DEBUG_MODE:
                 log.warning(f"Could not connect to {cls.__name__}: {e} Using FakeAdapter.")
                 instrument = cls(FakeAdapter(), **kwargs)
             else:
@@ -123,9 +154,7 @@ class InstrumentManager:
             and adapter.
         :param kwargs: Additional keyword arguments to pass to the instrument class.
         """
-        if name is None:
-            name = f"{cls.__name__}/{adapter}"
-
+        name = self.instance_name(cls, adapter, name)
         if name not in self.instances:
             try:
                 instrument = self.setup_adapter(cls, adapter, **kwargs)
@@ -141,20 +170,83 @@ class InstrumentManager:
 
         return self.instances[name]
 
+    def connect_all(
+        self, pending: Dict[str, PendingInstrument]
+    ) -> Dict[str, AnyInstrument]:
+        """Connects to several pending instruments and saves them in the
+        dictionary. Instruments on independent ports are set up concurrently,
+        each in its own thread. Instruments on a GPIB bus, already connected,
+        or repeated are connected sequentially afterwards.
+
+        :param pending: Dictionary of PendingInstruments.
+        :return: Dictionary with the same keys and the connected instruments.
+        """
+        parallel: Dict[str, tuple[str, dict]] = {}
+        sequential: Dict[str, dict] = {}
+        names = set()
+        for key, instrument in pending.items():
+            config = dict(instrument.config)
+            name = self.instance_name(config['cls'], config['adapter'], config.pop('name'))
+            if name in self.instances or name in names or \
+                    str(config['adapter']).upper().startswith('GPIB'):
+                sequential[key] = instrument.config
+            else:
+                names.add(name)
+                parallel[key] = (name, config)
+
+        connected: Dict[str, AnyInstrument] = {}
+        error = None
+        if parallel:
+            with ThreadPoolExecutor(max_workers=len(parallel)) as pool:
+                futures = {
+                    key: (name, pool.submit(self.setup_adapter, **config))
+                    for key, (name, config) in parallel.items()
+                }
+
+            for key, (name, future) in futures.items():
+                try:
+                    instrument = future.result()
+                except Exception as e:
+                    log.error(f"Failed to connect to instrument '{name}': {e}")
+                    error = error or e
+                    continue
+
+                self.instances[name] = instrument
+                connected[key] = instrument
+                log.debug(f"Connected '{name}' as {type(instrument).__name__} via {instrument.adapter}")
+
+        if error is not None:
+            raise error
+
+        for key, config in sequential.items():
+            connected[key] = self.connect(**config)
+
+        return connected
+
+    @staticmethod
+    def instance_name(cls: AnyInstrument, adapter: str = None, name: str = None) -> str:
+        """Returns the name an instrument is saved with. If no name is given,
+        it uses the class name and adapter.
+        """
+        return name if name is not None else f"{cls.__name__}/{adapter}"
+
     def shutdown(self, name: str):
         """Safely shuts down the instrument with the given name.
 
         :param name: The name of the instrument to shutdown.
         """
-        try:
-            _ = self.instances[name]
-        except KeyError:
+        instrument = self.instances.pop(name, None)
+        if instrument is None:
             log.error(f"Instrument '{name}' not found.")
             return
 
+        self._shutdown(name, instrument)
+
+    @staticmethod
+    def _shutdown(name: str, instrument: AnyInstrument):
+        """Shuts down an instrument already removed from the dictionary."""
         try:
-            self.instances[name].shutdown()
-            del self.instances[name]
+            instrument.shutdown()
             log.debug(f"Instrument '{name}' was shut down.")
         except Exception as e:
             log.error(f"Error shutting down instrument '{name}': {e}")
@@ -166,5 +258,27 @@ class InstrumentManager:
             return
 
         log.info("Shutting down all instruments.")
-        for name in list(self.instances):
-            self.shutdown(name)
+        # Only instruments that declare an independent shutdown (e.g. sensors)
+        # are shut down concurrently. Sources ramp down and GPIB instruments
+        # share the bus, so they are shut down one after the other (last
+        # connected first) in a single task
+        independent, ordered = [], []
+        while self.instances:
+            name, instrument = self.instances.popitem()
+            resource = str(getattr(instrument.adapter, 'resource_name', ''))
+            parallel = (
+                getattr(instrument, 'independent_shutdown', False)
+                and not resource.upper().startswith('GPIB')
+            )
+            (independent if parallel else ordered).append((name, instrument))
+
+        def shutdown_ordered():
+            for name, instrument in ordered:
+                self._shutdown(name, instrument)
+
+        with ThreadPoolExecutor(max_workers=len(independent) + bool(ordered)) as pool:
+            for name, instrument in independent:
+                pool.submit(self._shutdown, name, instrument)
+
+            if ordered:
+                pool.submit(shutdown_ordered)
@@ -1,4 +1,4 @@
-import time
+import os
 import logging
 import numpy as np
 import threading
@@ -13,6 +13,8 @@ class PT100SerialSensor(Instrument):
     """Instrument class for the PT100 temperature sensor using PyMeasure's
     SerialAdapter.
     """
+    independent_shutdown = True
+
     def __init__(
         self,
         port: str,
@@ -39,26 +41,44 @@ class PT100SerialSensor(Instrument):
             includeSCPI=includeSCPI,
             **kwargs
         )
+        # Skip the USB-serial latency timer (16 ms by default on Linux), since
+        # every reading is a short request/reply round trip
+        try:
+            self.adapter.connection.set_low_latency_mode(True)
+        except (AttributeError, NotImplementedError, OSError, ValueError) as e:
+            log.debug(f"Could not set low latency mode on {port}: {e}")
+
         log.info(f"{self.name} initialized on port {port} at {baudrate} baud.")
         self.clock = np.nan
         self.plate_temp = np.nan
         self.ambient_temp = np.nan
         self.data = (self.plate_temp, self.ambient_temp, self.clock)
         self.timeout = timeout
-        self._stop_thread = False
-        self._thread = threading.Thread(target=self._get_meas)
-        self._thread.daemon = True
+        self._stop_event = threading.Event()
+        self._io_lock = threading.Lock()
+        # The temperature request, encoded once and written directly to the port
+        self._request = f"R{self.adapter.write_termination}".encode('ascii')
+        self._thread = threading.Thread(
+            target=self._get_meas, name=f"PT100-{port}", daemon=True
+        )
         self._thread.start()
         # TODO: generalize threaded measurement for other instruments
 
     def _get_meas(self):
+        # Let the GUI take precedence over this thread (Linux only)
+        try:
+            os.sched_setscheduler(0, os.SCHED_BATCH, os.sched_param(0))
+        except (AttributeError, OSError):
+            pass
+
         try:
-            while not self._stop_thread:
+            # Reads block on the port, so the loop only yields briefly between
+            # samples. The event wakes it immediately on shutdown
+            while not self._stop_event.wait(0.001):
                 result = self.read_temperature()
                 if result:
                     self.plate_temp, self.ambient_temp, self.clock = result
                     self.data = result
-                time.sleep(0.001)
         except Exception as e:
             log.critical(f"{self.name} measurement thread failed: {e}")
 
@@ -67,36 +87,42 @@ class PT100SerialSensor(Instrument):
 
         :return: (plate_temp, ambient_temp, clock) or None if error
         """
-        self.write('R')
-        line = ''
-        start_time = time.time()
-        while True:
-            # Read available data without blocking
-            data = self.adapter.connection.read_all().decode('ascii', errors='ignore')
-            if data:
-                line += data
-                if '\r\n' in line:
-                    line = line.strip()
-                    break
-            if time.time() - start_time > self.timeout:
+        # The request and its reply are a single transaction on the port,
+        # shared between the measurement thread and any other caller
+        with self._io_lock:
+            # The port is closed (or about to be) once shutdown starts
+            if self._stop_event.is_set():
                 return None
-            time.sleep(0.001)  # Sleep briefly to prevent CPU overload
-        if line == "ERROR":
+
+            self.adapter.connection.write(self._request)
+            # Blocks until the terminator arrives or the port times out
+            raw = self.adapter.connection.read_until(b'\r\n')
+
+        if not raw.endswith(b'\r\n'):
+            return None
+
+        # int() and float() parse bytes directly, so the reply is not decoded
+        line = raw.strip()
+        if line == b"ERROR":
             log.error("Fault detected in temperature sensor.")
             return None
         try:
-            clock, plate, ambient = line.split(",")
-            clock = int(clock)
-            plate = float(plate)
-            ambient = float(ambient)
-            return plate, ambient, clock
+            clock, _, rest = line.partition(b",")
+            plate, _, ambient = rest.partition(b",")
+            return float(plate), float(ambient), int(clock)
         except ValueError:
             return None
 
     def shutdown(self):
         """Safely shuts down the serial connection.
         """
-        self._stop_thread = True
-        self._thread.join()
-        self.adapter.close()
+        self._stop_event.set()
+        self._thread.join(timeout=2*self.timeout)
+        if self._thread.is_alive():
+            log.warning(f"{self.name} measurement thread did not stop in time, closing the port after its current read.")
+
+        # Reads stop once the event is set, so with the lock held the
+        # thread no longer uses the port
+        with self._io_lock:
+            self.adapter.close()
         super().shutdown()
@@ -1,6 +1,6 @@
+import math
 import time
 import logging
-import numpy as np
 
 from pymeasure.instruments import Instrument
 from pymeasure.instruments.validators import truncated_range, strict_discrete_set
@@ -12,6 +12,8 @@ class TENMA(Instrument):
     """This class implements the communication with a TENMA instrument. It is
     a subclass of Pymeasure's Instrument class.
     """
+    voltage_range = [-60., 60.]
+
     current = Instrument.control(
         "ISET1?", "ISET1:%.2f", """Sets the current in Amps.""",
         validator=truncated_range,
@@ -21,7 +23,7 @@ class TENMA(Instrument):
     voltage = Instrument.control(
         "VSET1?", "VSET1:%.2f", """Sets the voltage in Volts.""",
         validator=truncated_range,
-        values=[-60., 60.]
+        values=voltage_range
     )
 
     output = Instrument.control(
@@ -54,10 +56,23 @@ class TENMA(Instrument):
         :param vg_step: The step size in Volts.
         :param step_time: The time between steps in seconds.
         """
+        vg_end = truncated_range(vg_end, self.voltage_range)
         v = self.voltage
+        # The setpoint has a resolution of 10 mV, skip ramps that would not change it
+        if round(v, 2) == round(vg_end, 2):
+            return
+
+        # The steps stay within the valid range, so they are formatted once
+        # and written directly, without going through the voltage control
+        # The loop stops before crossing vg_end, so the direction is fixed
+        step = math.copysign(vg_step, vg_end - v)
+        commands = []
         while abs(vg_end - v) > vg_step:
-            v += np.sign(vg_end - v) * vg_step
-            self.voltage = v
+            v += step
+            commands.append(f"VSET1:{v:.2f}")
+
+        for command in commands:
+            self.write(command)
             time.sleep(step_time)
         self.voltage = vg_end
 
@@ -52,9 +52,12 @@ class BaseProcedure(Procedure):
         """
         log.info("Setting up instruments")
         all_attrs = {**self.__class__.__dict__, **self.__dict__}
-        for key, instrument in all_attrs.items():
-            if isinstance(instrument, PendingInstrument):
-                setattr(self, key, self.instruments.connect(**instrument.config))
+        pending = {
+            key: instrument for key, instrument in all_attrs.items()
+            if isinstance(instrument, PendingInstrument)
+        }
+        for key, instrument in self.instruments.connect_all(pending).items():
+            setattr(self, key, instrument)
 
     def shutdown(self):
         if not self.should_stop() and self.status >= self.RUNNING and self.chained_exec: